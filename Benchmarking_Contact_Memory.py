@@ -0,0 +1,46 @@
+import sys
+import tracemalloc
+
+from app import Contact
+
+# Compare the memory used by N contacts stored as plain dicts (the old way)
+# against N compact Contact records (__slots__ + interned category strings).
+N = 100000
+
+CATEGORIES = ["Work", "Personal"]
+DEPARTMENTS = ["Engineering", "Human Resources", "Family", "Friends"]
+TEAMS = ["Platform", "Security", "Recruitment", "Payroll", "College Friends", "Neighborhood"]
+
+def contact_fields(i):
+    # Build the category strings at runtime (like form input does) so they are not already shared constants
+    return {
+        "id": 1000 + i,
+        "name": f"Contact {i}",
+        "email": f"contact{i}@example.com",
+        "category": "".join(CATEGORIES[i % len(CATEGORIES)]),
+        "subcategory": "".join(["", "Engineers", "HR"][i % 3]),
+        "department": "".join(DEPARTMENTS[i % len(DEPARTMENTS)]),
+        "team": "".join(TEAMS[i % len(TEAMS)]),
+        "emergency_priority": i % 10,
+    }
+
+def measure(build):
+    tracemalloc.start()
+    items = [build(contact_fields(i)) for i in range(N)]
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return items, current
+
+def benchmark_memory():
+    dicts, dict_bytes = measure(dict)
+    del dicts
+    records, record_bytes = measure(Contact)
+
+    print(f"{N} contacts as dicts:           {dict_bytes / 1024 / 1024:.1f} MB ({dict_bytes // N} bytes/contact)")
+    print(f"{N} contacts as Contact records: {record_bytes / 1024 / 1024:.1f} MB ({record_bytes // N} bytes/contact)")
+    print(f"Size of one dict: {sys.getsizeof(contact_fields(0))} bytes, one Contact: {sys.getsizeof(records[0])} bytes")
+
+    if record_bytes > 0:
+        print(f"Contact records use {dict_bytes / record_bytes:.2f}x less memory than dicts.")
+
+benchmark_memory()
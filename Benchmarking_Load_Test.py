@@ -0,0 +1,135 @@
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+import urllib.parse
+import urllib.request
+
+# Throughput as workers are added. Two modes:
+#   python Benchmarking_Load_Test.py
+#       Starts 1, 2, 4, ... up to one worker process per core. Each has its own copy of the app
+#       (like gunicorn workers) sharing one SQLite database, and drives it through the Flask test client.
+#       Every worker count starts from a freshly seeded database; each row reports how many contacts it
+#       held at the end (the seeded ones plus every /add), so lost or duplicated writes show up.
+#   python Benchmarking_Load_Test.py --url http://localhost:8000 --clients 1,8,32
+#       Sends HTTP requests from 1, 8, 32 client threads to a running server, e.g.
+#       gunicorn --workers 4 --threads 4 app:app
+
+SEARCH_NAMES = ["Alice", "Bob", "Charlie", "Diana", "Eve", "Frank", "Grace", "Nobody"]
+
+# (method, path, form) for one request: mostly reads, about 5% writes
+def next_request(rng):
+    roll = rng.random()
+    if roll < 0.30:
+        return "GET", "/?order=name&limit=20", None
+    if roll < 0.55:
+        return "GET", f"/search?query={rng.choice(SEARCH_NAMES)}", None
+    if roll < 0.75:
+        return "GET", f"/search_id?id={rng.randint(1000, 1011)}", None
+    if roll < 0.95:
+        return "GET", f"/find_connection?id1={rng.randint(1000, 1011)}&id2={rng.randint(1000, 1011)}", None
+    name = f"Load {rng.randrange(10 ** 9)}"
+    return "POST", "/add", {"name": name, "email": "load@example.com", "category": "Work", "emergency_priority": "5"}
+
+def run_test_client_worker(worker, seconds, results):
+    from app import app  # Imported here so every process builds its own copy of the state
+
+    client = app.test_client()
+    rng = random.Random(worker)
+    count = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        method, path, form = next_request(rng)
+        response = client.open(path, method=method, data=form)
+        response.close()
+        count += 1
+    results.put(count)
+
+def run_processes(workers, seconds):
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    processes = [context.Process(target=run_test_client_worker, args=(i, seconds, results)) for i in range(workers)]
+    for process in processes:
+        process.start()
+    total = sum(results.get() for _ in processes)
+    for process in processes:
+        process.join()
+    return total
+
+def run_http_clients(url, clients, seconds):
+    counts = [0] * clients
+    errors = [0] * clients
+    deadline = time.perf_counter() + seconds
+
+    def client(i):
+        rng = random.Random(i)
+        while time.perf_counter() < deadline:
+            method, path, form = next_request(rng)
+            data = urllib.parse.urlencode(form).encode() if form else None
+            try:
+                with urllib.request.urlopen(urllib.request.Request(url + path, data=data, method=method)) as response:
+                    response.read()
+                counts[i] += 1
+            except OSError:
+                errors[i] += 1
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(counts), sum(errors)
+
+def main():
+    parser = argparse.ArgumentParser(description="Contact Manager load test")
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--workers", default=None, help="comma separated worker counts, default 1,2,4,... up to the core count")
+    parser.add_argument("--url", default=None, help="load test a running server instead")
+    parser.add_argument("--clients", default="1,4,16", help="client thread counts for --url")
+    args = parser.parse_args()
+
+    results = []
+    if args.url:
+        for clients in [int(n) for n in args.clients.split(",")]:
+            total, errors = run_http_clients(args.url.rstrip("/"), clients, args.seconds)
+            results.append({"clients": clients, "requests": total, "errors": errors,
+                            "requests_per_sec": round(total / args.seconds)})
+            print(json.dumps(results[-1]))
+    else:
+        cores = os.cpu_count() or 1
+        if args.workers:
+            counts = [int(n) for n in args.workers.split(",")]
+        else:
+            counts, n = [], 1
+            while n < cores:
+                counts.append(n)
+                n *= 2
+            counts.append(cores)
+
+        with tempfile.TemporaryDirectory() as directory:
+            os.environ.setdefault("STREAM_INDEX", "0")
+            for run, workers in enumerate(counts):
+                path = os.path.join(directory, f"load_test_{run}.db")
+                os.environ["DATABASE_URL"] = f"sqlite:///{path}"  # Spawned workers inherit it
+                total = run_processes(workers, args.seconds)
+                with sqlite3.connect(path) as conn:
+                    stored = conn.execute("SELECT COUNT(*) FROM contacts").fetchone()[0]
+                conn.close()
+                results.append({"workers": workers, "requests": total, "requests_per_sec": round(total / args.seconds),
+                                "contacts": stored})
+                print(json.dumps(results[-1]))
+
+        base = results[0]["requests_per_sec"] or 1
+        for result in results:
+            result["speedup"] = round(result["requests_per_sec"] / base, 2)
+        print(f"Cores: {cores}")
+
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
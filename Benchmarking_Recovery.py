@@ -0,0 +1,153 @@
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+# Crash-recovery round trip for the JOURNAL_DIR op log and snapshots, or for a SQLite DATABASE_URL store.
+#   python Benchmarking_Recovery.py
+#   python Benchmarking_Recovery.py --contacts 100000 --ops 2000 --snapshot-every 500
+#   python Benchmarking_Recovery.py --database
+# A writer process runs a random mix of adds, batch deletes of adjacent and scattered contacts, undo/redo,
+# connections, sorts and priority updates, syncs the log and exits without shutting down (a crash).
+# A second process recovers from the same directory; the script exits with status 1 unless the recovered
+# contact order, fields, connections and next id match what the writer had.
+# With --database a follower process loads the database before the writer starts, like a second worker.
+# Once the writer is done it has to see that its copy is stale and reload it on its next request, and a
+# fresh process started afterwards (a restart) has to load the same state.
+
+# The state recovery has to reproduce, in a form that survives a JSON round trip.
+# With a database new ids come from its contact_ids counter, so the store version is compared instead of next_id.
+def app_state(contact_app):
+    state = {
+        "contacts": [contact.to_dict() for contact in contact_app.contacts],
+        "graph": {str(contact_id): sorted(neighbors) for contact_id, neighbors in contact_app.friendship_graph.items()},
+    }
+    if contact_app.contact_store:
+        state["version"] = contact_app.contact_store.version
+    else:
+        state["next_id"] = contact_app.next_id
+    return state
+
+# Prints the report and returns the parts of the state that differ from what the writer had
+def compare(contact_app, expected_path, **report):
+    with open(expected_path, encoding="utf-8") as expected_file:
+        expected = json.load(expected_file)
+    recovered = json.loads(json.dumps(app_state(contact_app)))
+    mismatches = [part for part in expected if recovered[part] != expected[part]]
+    print(json.dumps({"contacts": len(recovered["contacts"]), **report, "mismatches": mismatches}, indent=2))
+    return mismatches
+
+def write(contacts, ops, seed, expected_path):
+    import app as contact_app
+    client = contact_app.app.test_client()
+    rng = random.Random(seed)
+
+    batch = contact_app.app.config['API_MAX_BATCH']
+    for start in range(0, contacts, batch):
+        rows = [{"name": f"Contact {i}", "email": f"user{i}@example.com", "category": rng.choice(["Work", "Personal"]),
+                 "emergency_priority": rng.randint(1, 10)} for i in range(start, min(start + batch, contacts))]
+        client.post("/api/contacts/batch_add", json={"contacts": rows})
+    contact_app.undo_log.clear()  # Keep undo from taking back the initial load
+
+    for _ in range(ops):
+        ids = [contact["id"] for contact in contact_app.contacts]
+        roll = rng.random()
+        if len(ids) < 10 or 0.65 <= roll < 0.75:
+            client.post("/add", data={"name": f"Added {rng.random()}", "email": "added@example.com", "category": "Work"})
+        elif roll < 0.25:
+            # Adjacent runs are what the batch restore on undo has to put back in place
+            start = rng.randrange(len(ids))
+            client.post("/api/contacts/batch_delete", json={"ids": ids[start:start + rng.randint(1, 5)]})
+        elif roll < 0.35:
+            client.post("/api/contacts/batch_delete", json={"ids": rng.sample(ids, min(len(ids), 5))})
+        elif roll < 0.55:
+            client.post("/undo")
+        elif roll < 0.65:
+            client.post("/redo")
+        elif roll < 0.80:
+            client.post("/add_connection", data={"id1": str(rng.choice(ids)), "id2": str(rng.choice(ids))})
+        elif roll < 0.85:
+            client.post("/api/connections/batch_add", json={"pairs": [rng.sample(ids, 2) for _ in range(5)]})
+        elif roll < 0.95:
+            client.post("/update_priority", data={"id": str(rng.choice(ids)), "emergency_priority": str(rng.randint(1, 10))})
+        else:
+            client.post("/sort", data={"by": rng.choice(["name", "emergency_priority,name", "id"])})
+
+    with open(expected_path, "w", encoding="utf-8") as out:
+        json.dump(app_state(contact_app), out)
+    if contact_app.journal:
+        contact_app.journal.sync()
+    os._exit(0)  # Crash: skip atexit, so there is no clean shutdown snapshot
+
+def recover(expected_path):
+    start = time.perf_counter()
+    import app as contact_app  # Recovers from JOURNAL_DIR (or loads DATABASE_URL) on import
+    seconds = time.perf_counter() - start
+    sys.exit(1 if compare(contact_app, expected_path, recovery_seconds=round(seconds, 3)) else 0)
+
+# Second worker: loaded before the writer runs, catches up on its first request once the writer is done
+def follow(expected_path):
+    import app as contact_app
+    client = contact_app.app.test_client()
+    print("ready", flush=True)
+    sys.stdin.readline()  # The writer has finished
+
+    stale = contact_app.contact_store.is_stale()
+    start = time.perf_counter()
+    client.get("/metrics")  # STORE_POLL_INTERVAL=0, so this request checks the store and reloads it
+    seconds = time.perf_counter() - start
+    mismatches = compare(contact_app, expected_path, stale_before_request=stale, reload_seconds=round(seconds, 3))
+    sys.exit(1 if mismatches or not stale else 0)
+
+def main():
+    parser = argparse.ArgumentParser(description="Contact Manager crash-recovery round trip")
+    parser.add_argument("--contacts", type=int, default=10000, help="contacts added before the random operations")
+    parser.add_argument("--ops", type=int, default=1000, help="random operations after the initial load")
+    parser.add_argument("--snapshot-every", type=int, default=250, help="SNAPSHOT_EVERY for the writer")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--database", action="store_true", help="write through to a SQLite database instead of the op log")
+    parser.add_argument("--phase", choices=["write", "recover", "follow"], help=argparse.SUPPRESS)
+    parser.add_argument("--expected", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.phase == "write":
+        write(args.contacts, args.ops, args.seed, args.expected)
+    if args.phase == "recover":
+        recover(args.expected)
+    if args.phase == "follow":
+        follow(args.expected)
+
+    with tempfile.TemporaryDirectory() as directory:
+        if args.database:
+            env = dict(os.environ, DATABASE_URL="sqlite:///" + os.path.join(directory, "contacts.db"), STORE_POLL_INTERVAL="0")
+            env.pop("JOURNAL_DIR", None)
+        else:
+            env = dict(os.environ, JOURNAL_DIR=os.path.join(directory, "journal"), SNAPSHOT_EVERY=str(args.snapshot_every))
+            env.pop("DATABASE_URL", None)  # The op log is only used without a database
+        expected = os.path.join(directory, "expected.json")
+        common = [sys.executable, os.path.abspath(__file__), "--expected", expected]
+
+        follower = None
+        if args.database:
+            follower = subprocess.Popen(common + ["--phase", "follow"], env=env, stdin=subprocess.PIPE,
+                                        stdout=subprocess.PIPE, text=True)
+            for line in follower.stdout:  # Wait until it has loaded (and seeded) the database
+                if line.strip() == "ready":
+                    break
+
+        subprocess.run(common + ["--phase", "write", "--contacts", str(args.contacts), "--ops", str(args.ops),
+                                 "--seed", str(args.seed)], env=env, check=True)
+        failed = False
+        if follower:
+            output, _ = follower.communicate("done\n")
+            print(output, end="")
+            failed = follower.returncode != 0
+        failed = subprocess.run(common + ["--phase", "recover"], env=env).returncode != 0 or failed
+        sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,383 @@
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+# Benchmark every data structure and route of the Contact Manager on synthetic address books.
+#   python Benchmarking_Suite.py                                  1k, 10k and 100k contacts
+#   python Benchmarking_Suite.py --sizes 1000000 --ops 500        one million contacts
+#   python Benchmarking_Suite.py --output new.json --baseline old.json
+#       exits with status 1 if any benchmark got more than --tolerance slower than in old.json
+# Each result has ops/sec, p50/p99 latency in microseconds and the peak traced memory of a short extra run.
+
+for variable in ("DATABASE_URL", "JOURNAL_DIR"):
+    os.environ.pop(variable, None)  # Benchmark the in-memory structures only
+os.environ.setdefault("STREAM_INDEX", "0")
+
+import app as contact_app
+from app import app, Contact, LinkedList, CategoryBST, EmergencyPriorityQueue
+
+FIRST_NAMES = ["Alice", "Bob", "Charlie", "Diana", "Eve", "Frank", "Grace", "Heidi", "Ivan", "Judy",
+               "Karl", "Leo", "Maria", "Nina", "Omar", "Priya", "Quinn", "Rosa", "Sam", "Tara"]
+LAST_NAMES = ["Smith", "Jones", "Garcia", "Chen", "Patel", "Kim", "Nguyen", "Brown", "Lopez", "Silva",
+              "Khan", "Novak", "Rossi", "Muller", "Sato", "Haddad", "Okafor", "Larsen", "Dubois", "Ivanova"]
+
+# category -> department -> teams, like a real company directory plus a personal side
+CATEGORY_TREE = {
+    "Work": {
+        "Engineering": ["Platform", "Security", "Mobile", "Data", "Infrastructure", "Frontend"],
+        "Human Resources": ["Recruitment", "Payroll", "Benefits"],
+        "Sales": ["Enterprise", "SMB", "Partnerships", "EMEA", "APAC"],
+        "Finance": ["Accounting", "Treasury"],
+        "Support": ["Tier 1", "Tier 2", "Escalations"],
+    },
+    "Personal": {
+        "Family": ["Immediate Family", "Cousins", "In-laws"],
+        "Friends": ["College Friends", "Neighborhood", "Gaming Friends", "Book Club"],
+    },
+    "Community": {
+        "Sports": ["Soccer Team", "Running Club"],
+        "Volunteering": ["Food Bank", "Animal Shelter"],
+    },
+}
+TEAM_PATHS = [(category, department, team)
+              for category, departments in CATEGORY_TREE.items()
+              for department, teams in departments.items()
+              for team in teams]
+
+FIRST_ID = 1000
+
+def make_address_book(size, seed=42, average_degree=6):
+    rng = random.Random(seed)
+    # A few big teams and a long tail of small ones
+    weights = [1 / (rank + 1) for rank in range(len(TEAM_PATHS))]
+    rng.shuffle(weights)
+
+    contacts = []
+    members = {}
+    for i in range(size):
+        category, department, team = rng.choices(TEAM_PATHS, weights)[0]
+        contact_id = FIRST_ID + i
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        if rng.random() < 0.7:
+            name += f" {i}"  # Most names unique, the rest shared
+        contacts.append({
+            "id": contact_id,
+            "name": name,
+            "email": f"user{i}@example.com",
+            "category": category,
+            "subcategory": "Engineers" if department == "Engineering" else "",
+            "department": department,
+            "team": team,
+            # Most contacts have no emergency role, a few have priorities 1-10
+            "emergency_priority": rng.randint(1, 10) if rng.random() < 0.1 else 999,
+        })
+        members.setdefault((category, department, team), []).append(contact_id)
+
+    # Friendships: mostly inside the same team (clusters), some across the whole book (small world)
+    graph = {contact["id"]: {} for contact in contacts}
+    for contact in contacts:
+        team_members = members[(contact["category"], contact["department"], contact["team"])]
+        for _ in range(average_degree // 2):
+            if rng.random() < 0.8 and len(team_members) > 1:
+                other = rng.choice(team_members)
+            else:
+                other = FIRST_ID + rng.randrange(size)
+            if other != contact["id"]:
+                graph[contact["id"]][other] = None
+                graph[other][contact["id"]] = None
+    return contacts, graph
+
+# Replace the app's state with a synthetic address book and rebuild every structure
+def load_address_book(rows, graph):
+    contact_app.contacts = LinkedList()
+    for row in rows:
+        contact_app.contacts.append(Contact(row))
+    contact_app.friendship_graph = graph
+    contact_app.next_id = FIRST_ID + len(rows)
+    contact_app.undo_log.clear()
+    contact_app.redo_log.clear()
+    contact_app.rebuild_all_structures()
+
+# The name with two neighbouring letters swapped, like a fast typist would
+def with_typo(name, rng):
+    i = rng.randrange(len(name) - 1)
+    return name[:i] + name[i + 1] + name[i] + name[i + 2:]
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+# Time op(i) for i in range(ops), then repeat a few ops under tracemalloc for the memory peak
+def measure(op, ops, setup=None, memory_ops=20):
+    if setup:
+        setup()
+    timings = []
+    clock = time.perf_counter_ns
+    for i in range(ops):
+        start = clock()
+        op(i)
+        timings.append(clock() - start)
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for i in range(min(ops, memory_ops)):
+        op(ops + i)
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+
+    timings.sort()
+    total = sum(timings)
+    return {
+        "ops": ops,
+        "ops_per_sec": round(ops / (total / 1e9)) if total else None,
+        "p50_us": round(percentile(timings, 0.50) / 1000, 2),
+        "p99_us": round(percentile(timings, 0.99) / 1000, 2),
+        "peak_kb": round(max(peak, 0) / 1024, 1),
+    }
+
+def structure_benchmarks(size, ops, rng):
+    ids = [FIRST_ID + rng.randrange(size) for _ in range(ops + 100)]
+    names = [contact_app.find_contact_by_id(contact_id)["name"] for contact_id in ids]
+    benchmarks = {}
+
+    # LinkedList
+    def append_remove(i):
+        contact = Contact(id=10 ** 9 + i, name=f"Bench {i}", email="b@example.com")
+        contact_app.contacts.append(contact)
+        contact_app.contacts.remove_by_id(contact["id"])
+    benchmarks["linked_list.append_remove"] = measure(append_remove, ops)
+    benchmarks["linked_list.find_by_id"] = measure(lambda i: contact_app.contacts.find_by_id(ids[i % len(ids)]), ops)
+    benchmarks["linked_list.find_by_name"] = measure(lambda i: contact_app.contacts.find_by_name(names[i % len(names)]), ops)
+    benchmarks["linked_list.move"] = measure(lambda i: contact_app.contacts.move(ids[i % len(ids)], ids[(i + 1) % len(ids)]), ops)
+    benchmarks["linked_list.page_after"] = measure(lambda i: contact_app.contacts.page_after(ids[i % len(ids)], 50), ops)
+    benchmarks["linked_list.merge_sort"] = measure(
+        lambda i: contact_app.sort_contacts_list(contact_app.contacts, ["name"], "merge"), 3, memory_ops=1)
+
+    # Name search: prefix over the sorted name view, fuzzy over the trigram index with one typo per query
+    typos = [with_typo(name, rng) for name in names]
+    benchmarks["name_search.fuzzy"] = measure(lambda i: contact_app.name_search.search(typos[i % len(typos)]), ops)
+    benchmarks["name_search.fuzzy_exact"] = measure(lambda i: contact_app.name_search.search(names[i % len(names)]), ops)
+    benchmarks["contacts_with_name_prefix"] = measure(lambda i: contact_app.contacts_with_name_prefix(names[i % len(names)][:3]), ops)
+    benchmarks["autocomplete_names"] = measure(lambda i: contact_app.autocomplete_names(names[i % len(names)][:3]), ops)
+
+    # FieldIndex: one selective and one broad multi-field filter, first page only
+    filters = [contact_app.parse_filter(f"category={category} AND department={department} AND priority<=3")
+               for category, department, _ in TEAM_PATHS]
+    broad = contact_app.parse_filter("category=Work AND priority>=1")
+    benchmarks["field_index.query"] = measure(lambda i: contact_app.field_index.query(filters[i % len(filters)], None, 100), ops)
+    benchmarks["field_index.query_broad"] = measure(lambda i: contact_app.field_index.query(broad, None, 100), ops)
+
+    # CategoryBST (a fresh tree so the app's counts are left alone)
+    bst = CategoryBST()
+    categories = [f"Category {n}" for n in range(1000)]
+    def bst_insert_remove(i):
+        bst.insert(categories[i % len(categories)])
+        if i % 2:
+            bst.remove(categories[(i - 1) % len(categories)])
+    benchmarks["category_bst.insert_remove"] = measure(bst_insert_remove, ops)
+    benchmarks["category_bst.search"] = measure(lambda i: bst.search(categories[i % len(categories)]), ops)
+    benchmarks["category_bst.inorder"] = measure(lambda i: bst.inorder(), min(ops, 200), memory_ops=5)
+
+    # EmergencyPriorityQueue
+    queue = EmergencyPriorityQueue()
+    queue.build(contact_app.contacts_by_id.values())
+    benchmarks["emergency_queue.build"] = measure(
+        lambda i: queue.build(contact_app.contacts_by_id.values()), 3, memory_ops=1)
+    benchmarks["emergency_queue.update_priority"] = measure(
+        lambda i: queue.update_priority(ids[i % len(ids)], i % 10 + 1), ops)
+    def pop_push(i):
+        contact = queue.pop()
+        queue.push(contact)
+    benchmarks["emergency_queue.pop_push"] = measure(pop_push, ops)
+    benchmarks["emergency_queue.top_k"] = measure(lambda i: queue.top_k(10), ops)
+
+    # BFS: cold (empty path cache) and warm (repeated pairs)
+    pairs = [(ids[i % len(ids)], ids[(i * 7 + 3) % len(ids)]) for i in range(ops + 100)]
+    bfs_ops = max(1, ops // 10)
+    benchmarks["bfs_connection_path.cold"] = measure(
+        lambda i: contact_app.bfs_connection_path(*pairs[i]),
+        bfs_ops, setup=lambda: contact_app.path_cache.build(contact_app.friendship_graph))
+    benchmarks["bfs_connection_path.warm"] = measure(lambda i: contact_app.bfs_connection_path(*pairs[i % bfs_ops]), ops)
+    benchmarks["bfs_connection_path.max_depth_3"] = measure(
+        lambda i: contact_app.bfs_connection_path(*pairs[i], max_depth=3),
+        bfs_ops, setup=lambda: contact_app.path_cache.build(contact_app.friendship_graph))
+
+    # CategoryTree aggregates: a priority change refreshes one path, then the whole-tree rollup is re-read
+    def priority_change_rollup(i):
+        contact_app.set_emergency_priority(contact_app.find_contact_by_id(ids[i % len(ids)]), i % 10 + 1)
+        contact_app.category_tree.root.rollup()
+    benchmarks["category_tree.priority_change_rollup"] = measure(priority_change_rollup, ops)
+    benchmarks["category_tree.summary"] = measure(
+        lambda i: contact_app.category_tree.summary(" > ".join(TEAM_PATHS[i % len(TEAM_PATHS)][:2])), ops)
+
+    # quick_sort (introsort) over a shuffled copy of the contacts
+    rows = list(contact_app.contacts)
+    def sort_copy(i):
+        copy = rows[:]
+        random.Random(i).shuffle(copy)
+        contact_app.quick_sort(copy, 0, len(copy) - 1)
+    benchmarks["quick_sort"] = measure(sort_copy, 3, memory_ops=1)
+
+    benchmarks["rebuild_all_structures"] = measure(lambda i: contact_app.rebuild_all_structures(), 2, memory_ops=1)
+    return benchmarks
+
+def route_benchmarks(size, ops, rng):
+    client = app.test_client()
+    ids = [FIRST_ID + rng.randrange(size) for _ in range(ops + 100)]
+    names = [contact_app.find_contact_by_id(contact_id)["name"] for contact_id in ids]
+    typos = [with_typo(name, rng) for name in names]
+    paths = [" > ".join(path) for path in TEAM_PATHS]
+
+    def get(url):
+        return lambda i: client.get(url(i)).close()
+
+    def post(url, data=None, json_body=None):
+        return lambda i: client.post(url, data=data(i) if data else None, json=json_body(i) if json_body else None).close()
+
+    new_contact = lambda i: {"name": f"Route Bench {i}", "email": "bench@example.com", "category": "Work",
+                             "department": "Engineering", "team": "Platform", "emergency_priority": "5"}
+    page_ops = max(1, ops // 10)
+    benchmarks = {
+        "GET /": measure(get(lambda i: "/"), page_ops),
+        "GET /?order=name": measure(get(lambda i: "/?order=name"), page_ops),
+        "GET /?order=emergency_priority": measure(get(lambda i: "/?order=emergency_priority"), page_ops),
+        "GET /search": measure(get(lambda i: f"/search?query={names[i % len(names)]}"), ops),
+        "GET /search prefix": measure(get(lambda i: f"/search?query={names[i % len(names)][:3]}&mode=prefix"), ops),
+        "GET /search fuzzy": measure(get(lambda i: f"/search?query={typos[i % len(typos)]}&mode=fuzzy"), ops),
+        "GET /autocomplete_name": measure(get(lambda i: f"/autocomplete_name?prefix={names[i % len(names)][:3]}"), ops),
+        "GET /search_id": measure(get(lambda i: f"/search_id?id={ids[i % len(ids)]}"), ops),
+        "GET /search_id range": measure(get(lambda i: f"/search_id?from={ids[i % len(ids)]}&to={ids[i % len(ids)] + 500}&limit=100"), ops),
+        "GET /search_category": measure(get(lambda i: f"/search_category?path={paths[i % len(paths)]}"), ops),
+        "GET /category_summary": measure(get(lambda i: f"/category_summary?path={paths[i % len(paths)].rsplit(' > ', 1)[0]}"), ops),
+        "GET /autocomplete_category": measure(get(lambda i: f"/autocomplete_category?prefix={paths[i % len(paths)][:4]}"), ops),
+        "GET /filter": measure(get(lambda i: f"/filter?q=category={paths[i % len(paths)].split(' > ')[0]} AND priority<=3"), ops),
+        "GET /find_connection": measure(get(lambda i: f"/find_connection?id1={ids[i % len(ids)]}&id2={ids[(i * 7 + 3) % len(ids)]}"), page_ops),
+        "POST /add_connection": measure(post("/add_connection", lambda i: {"id1": ids[i % len(ids)], "id2": ids[(i + 1) % len(ids)]}), ops),
+        "POST /remove_connection": measure(post("/remove_connection", lambda i: {"id1": ids[i % len(ids)], "id2": ids[(i + 1) % len(ids)]}), ops),
+        "POST /update_priority": measure(post("/update_priority", lambda i: {"id": ids[i % len(ids)], "emergency_priority": i % 10 + 1}), ops),
+        "POST /add": measure(post("/add", new_contact), ops),
+        "POST /undo": measure(post("/undo"), ops),  # Takes the adds back out
+        "POST /redo": measure(post("/redo"), ops),  # And puts them back
+        "POST /delete": measure(post("/delete", lambda i: {"name": f"Route Bench {i}"}), ops),
+        "GET /history": measure(get(lambda i: "/history"), ops),
+        "GET /metrics": measure(get(lambda i: "/metrics"), page_ops),
+        "GET /activity": measure(get(lambda i: "/activity?limit=50"), ops),
+        "POST /api/contacts/batch_add": measure(post("/api/contacts/batch_add", json_body=lambda i: {
+            "contacts": [new_contact(10 ** 6 + i * 100 + n) for n in range(100)]}), page_ops),
+        "POST /api/contacts/search_name": measure(post("/api/contacts/search_name", json_body=lambda i: {
+            "names": names[i % len(names):i % len(names) + 20]}), ops),
+        "POST /api/contacts/query": measure(post("/api/contacts/query", json_body=lambda i: {
+            "query": f"team={TEAM_PATHS[i % len(TEAM_PATHS)][2]} AND priority!=999", "limit": 100}), ops),
+        "POST /api/contacts/search_id": measure(post("/api/contacts/search_id", json_body=lambda i: {
+            "ids": ids[i % len(ids):i % len(ids) + 20]}), ops),
+        "POST /api/connections/batch_add": measure(post("/api/connections/batch_add", json_body=lambda i: {
+            "pairs": [[ids[(i + n) % len(ids)], ids[(i + n + 1) % len(ids)]] for n in range(20)]}), page_ops),
+        "POST /api/contacts/batch_delete": measure(post("/api/contacts/batch_delete", json_body=lambda i: {
+            "ids": list(contact_app.sorted_ids.ids[-100:])}), page_ops),  # The newest 100 contacts
+        "POST /sort": measure(post("/sort", lambda i: {"by": "category,name", "algorithm": "merge"}), 2, memory_ops=1),
+        "GET /export": measure(lambda i: client.get("/export?format=csv").get_data(), 2, memory_ops=1),
+        "POST /reindex": measure(post("/reindex"), 2, memory_ops=1),
+    }
+
+    csv_rows = "".join(f"Imported {n},imported{n}@example.com,Work,,Sales,EMEA,5\n" for n in range(1000))
+    csv_file = "name,email,category,subcategory,department,team,emergency_priority\n" + csv_rows
+    benchmarks["POST /import (1000 rows)"] = measure(
+        lambda i: client.post("/import", data={"file": (io.BytesIO(csv_file.encode()), "contacts.csv")},
+                              content_type="multipart/form-data").close(), 2, memory_ops=1)
+
+    # Every registered route should have at least one benchmark above
+    covered = {name.split()[1].split("?")[0] for name in benchmarks}
+    missing = sorted(rule.rule for rule in app.url_map.iter_rules()
+                     if rule.endpoint != "static" and rule.rule not in covered)
+    if missing:
+        print(f"Warning: routes without a benchmark: {', '.join(missing)}", file=sys.stderr)
+    return benchmarks
+
+def run(sizes, ops, seed):
+    report = {"python": platform.python_version(), "platform": platform.platform(), "ops": ops, "sizes": {}}
+    for size in sizes:
+        rng = random.Random(seed)
+        start = time.perf_counter()
+        rows, graph = make_address_book(size, seed)
+        generated = time.perf_counter() - start
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        load_address_book(rows, graph)
+        loaded = time.perf_counter() - start
+        memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del rows
+
+        edges = sum(len(neighbors) for neighbors in contact_app.friendship_graph.values()) // 2
+        result = {
+            "contacts": size,
+            "edges": edges,
+            "generate_seconds": round(generated, 3),
+            "load_seconds": round(loaded, 3),
+            "load_memory_mb": round(memory[0] / 1024 / 1024, 1),
+            "load_peak_memory_mb": round(memory[1] / 1024 / 1024, 1),
+            "structures": structure_benchmarks(size, ops, rng),
+            "routes": route_benchmarks(size, ops, rng),
+        }
+        report["sizes"][str(size)] = result
+        print(f"{size} contacts: loaded in {loaded:.2f}s, {len(result['structures'])} structure "
+              f"and {len(result['routes'])} route benchmarks done", file=sys.stderr)
+    return report
+
+# Benchmarks whose ops/sec fell by more than tolerance compared to a previous report
+def regressions(report, baseline, tolerance):
+    found = []
+    for size, result in report["sizes"].items():
+        old_result = baseline.get("sizes", {}).get(size)
+        if not old_result:
+            continue
+        for group in ("structures", "routes"):
+            for name, numbers in result[group].items():
+                old = old_result.get(group, {}).get(name)
+                if old and old.get("ops_per_sec") and numbers["ops_per_sec"] is not None:
+                    change = numbers["ops_per_sec"] / old["ops_per_sec"] - 1
+                    if change < -tolerance:
+                        found.append({"size": int(size), "benchmark": name, "ops_per_sec": numbers["ops_per_sec"],
+                                      "baseline_ops_per_sec": old["ops_per_sec"], "change": round(change, 3)})
+    return found
+
+def main():
+    parser = argparse.ArgumentParser(description="Contact Manager benchmark suite")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="comma separated address book sizes")
+    parser.add_argument("--ops", type=int, default=2000, help="operations per micro-benchmark")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=None, help="write the JSON report here instead of stdout")
+    parser.add_argument("--baseline", default=None, help="previous JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed ops/sec drop vs the baseline (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    report = run([int(size) for size in args.sizes.split(",")], args.ops, args.seed)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            report["regressions"] = regressions(report, json.load(baseline_file), args.tolerance)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            out.write(text)
+    else:
+        print(text)
+
+    if report.get("regressions"):
+        for regression in report["regressions"]:
+            print(f"Regression: {regression['benchmark']} at {regression['size']} contacts "
+                  f"{regression['change']:+.0%} ({regression['baseline_ops_per_sec']} -> {regression['ops_per_sec']} ops/sec)",
+                  file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()